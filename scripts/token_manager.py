@@ -97,12 +97,13 @@ def get_cached_token() -> Optional[str]:
 
 def save_cached_token(token: str):
     """Save token to cache file"""
+    expiry = get_token_expiry(token)
     try:
         with open(TOKEN_CACHE_FILE, 'w') as f:
             json.dump({
                 'token': token,
                 'updated': datetime.now().isoformat(),
-                'expiry': get_token_expiry(token).isoformat() if get_token_expiry(token) else None
+                'expiry': expiry.isoformat() if expiry else None
             }, f, indent=2)
         # Secure the file
         os.chmod(TOKEN_CACHE_FILE, 0o600)
@@ -3,14 +3,10 @@ Pytest configuration and shared fixtures
 """
 import pytest
 import os
-import sys
 from unittest.mock import Mock, MagicMock
 import pandas as pd
 from datetime import datetime, timezone
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from tvDatafeed import TvDatafeed, TvDatafeedLive, Interval, Seis, Consumer
 
 
@@ -137,6 +133,15 @@ def mock_2fa_invalid_code_response():
     return response
 
 
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make time.sleep() a no-op so retry/backoff loops run instantly
+
+    Not autouse: threading and backoff-timing tests rely on real sleeps.
+    """
+    monkeypatch.setattr('time.sleep', lambda *args, **kwargs: None)
+
+
 @pytest.fixture
 def valid_totp_secret():
     """A valid TOTP secret for testing"""
@@ -144,6 +149,32 @@ def valid_totp_secret():
     return 'JBSWY3DPEHPK3PXP'
 
 
+def pytest_addoption(parser):
+    """Register custom command line options"""
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="run tests marked as slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Drop live tests without credentials and skip slow tests unless --runslow is given"""
+    if not os.getenv('TV_USERNAME') or not os.getenv('TV_PASSWORD'):
+        live = [item for item in items if getattr(item, 'cls', None) is not None
+                and item.cls.__name__ == 'TestLiveIntegration']
+        if live:
+            config.hook.pytest_deselected(items=live)
+            items[:] = [item for item in items if item not in live]
+
+    if config.getoption("--runslow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 # Marks for test categorization
 def pytest_configure(config):
     """Register custom markers"""
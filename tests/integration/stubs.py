@@ -0,0 +1,28 @@
+"""
+Test doubles shared by the integration tests
+"""
+
+
+class StubWS:
+    """Minimal stand-in for a WebSocket connection
+
+    Serves the given frames from recv(), then behaves like a socket
+    closed by the server. Avoids the call bookkeeping of Mock on the
+    hot recv() loop in get_hist().
+    """
+    __slots__ = ('_frames',)
+
+    def __init__(self, frames):
+        self._frames = iter(frames)
+
+    def recv(self):
+        try:
+            return next(self._frames)
+        except StopIteration:
+            raise ConnectionError("Connection closed") from None
+
+    def send(self, *args, **kwargs):
+        pass
+
+    def close(self):
+        pass
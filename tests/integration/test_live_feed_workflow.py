@@ -4,42 +4,90 @@ Integration tests for TvDatafeedLive workflow
 These tests verify the live feed functionality including threading,
 callbacks, and real-time data processing.
 """
+import json
 import time
 import pytest
 import threading
-from unittest.mock import patch, Mock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 from tvDatafeed import TvDatafeedLive, Interval
 
+from tests.integration.stubs import StubWS
+
+_OK_FRAME = '~m~52~m~{"m":"qsd","p":["qs_test123",{"n":"symbol_1","s":"ok"}]}'
+# Two bars starting an hour from now, so new_seis() gets a DataFrame and
+# the main loop's first update stays well beyond the end of the test
+_BAR_TS = int(time.time()) + 3600
+_BARS_FRAME = (
+    '~m~160~m~{"m":"timescale_update","p":["cs_test456",{"s1":{"s":['
+    f'{{"i":0,"v":[{_BAR_TS},1.0,2.0,0.5,1.5,100.0]}},'
+    f'{{"i":1,"v":[{_BAR_TS + 3600},1.5,2.5,1.0,2.0,200.0]}}'
+    ']}}]}'
+)
+_COMPLETED_FRAME = '~m~55~m~{"m":"series_completed","p":["cs_test456","s1","streaming"]}'
+# Shared, immutable frame sequence; each stub only iterates over it
+_OK_FRAMES = (_OK_FRAME, _BARS_FRAME, _COMPLETED_FRAME)
+
+# Every symbol the tests in this module create a Seis for
+_LISTED_SYMBOLS = ('BTCUSDT', 'ETHUSDT') + tuple(f'SYM{i}' for i in range(5))
+
+
+def _open_ok_connection(*args, **kwargs):
+    return StubWS(_OK_FRAMES)
+
+
+@pytest.fixture(scope="module")
+def _patched_io():
+    """Patch the WebSocket and HTTP entry points once for the whole module"""
+    handles = SimpleNamespace(ws=Mock(), get=Mock())
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('tvDatafeed.main.create_connection', handles.ws)
+        mp.setattr('tvDatafeed.main.requests.get', handles.get)
+        yield handles
+
+
+@pytest.fixture
+def search_text():
+    """Body returned by the mocked symbol search"""
+    return json.dumps([
+        {"symbol": symbol, "exchange": "BINANCE", "type": "crypto"}
+        for symbol in _LISTED_SYMBOLS
+    ])
+
+
+@pytest.fixture
+def mock_live_tv(_patched_io, search_text):
+    """Create a mocked TvDatafeedLive instance
+
+    Construction is cheap (no thread is started until the first
+    new_seis()), so each test gets a fresh instance while the
+    patches themselves are shared across the module.
+    """
+    _patched_io.ws.reset_mock(return_value=True, side_effect=True)
+    _patched_io.ws.side_effect = _open_ok_connection
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.text = search_text
+    _patched_io.get.reset_mock(return_value=True, side_effect=True)
+    _patched_io.get.return_value = mock_response
+
+    tv = TvDatafeedLive()
+    yield tv
+
+    # Cleanup
+    try:
+        tv.del_tvdatafeed()
+    except Exception:
+        pass
+
 
 @pytest.mark.integration
 @pytest.mark.threading
+@pytest.mark.xdist_group("live_feed_basics")
 class TestLiveFeedBasics:
     """Test basic live feed functionality"""
 
-    @pytest.fixture
-    def mock_live_tv(self):
-        """Create a mocked TvDatafeedLive instance"""
-        with patch('tvDatafeed.main.create_connection') as mock_ws, \
-             patch('tvDatafeed.main.requests.get') as mock_get:
-            mock_connection = MagicMock()
-            mock_ws.return_value = mock_connection
-            mock_connection.recv.return_value = '~m~52~m~{"m":"qsd","p":["qs_test123",{"n":"symbol_1","s":"ok"}]}'
-
-            # Mock search_symbol to return valid results
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.text = '[{"symbol": "BINANCE:BTCUSDT", "exchange": "BINANCE", "type": "crypto"}]'
-            mock_get.return_value = mock_response
-
-            tv = TvDatafeedLive()
-            yield tv
-
-            # Cleanup
-            try:
-                tv.del_tvdatafeed()
-            except Exception:
-                pass
-
     def test_live_feed_initialization(self, mock_live_tv):
         """Test that live feed can be initialized"""
         assert mock_live_tv is not None
@@ -77,32 +125,10 @@ class TestLiveFeedBasics:
 
 @pytest.mark.integration
 @pytest.mark.threading
+@pytest.mark.xdist_group("live_feed_seis")
 class TestSeisManagement:
     """Test SEIS (Symbol-Exchange-Interval Set) management"""
 
-    @pytest.fixture
-    def mock_live_tv(self):
-        """Create a mocked TvDatafeedLive for SEIS testing"""
-        with patch('tvDatafeed.main.create_connection') as mock_ws, \
-             patch('tvDatafeed.main.requests.get') as mock_get:
-            mock_connection = MagicMock()
-            mock_ws.return_value = mock_connection
-            mock_connection.recv.return_value = '~m~52~m~{"m":"qsd","p":["qs_test123",{"n":"symbol_1","s":"ok"}]}'
-
-            # Mock search_symbol to return valid results for any symbol
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.text = '[{"symbol": "BINANCE:BTCUSDT", "exchange": "BINANCE", "type": "crypto"}]'
-            mock_get.return_value = mock_response
-
-            tv = TvDatafeedLive()
-            yield tv
-
-            try:
-                tv.del_tvdatafeed()
-            except Exception:
-                pass
-
     def test_create_multiple_seis(self, mock_live_tv):
         """Test creating multiple SEIS for different symbols"""
         seis1 = mock_live_tv.new_seis(
@@ -151,32 +177,10 @@ class TestSeisManagement:
 
 @pytest.mark.integration
 @pytest.mark.threading
+@pytest.mark.xdist_group("live_feed_consumers")
 class TestConsumerManagement:
     """Test Consumer (callback) management"""
 
-    @pytest.fixture
-    def mock_live_tv(self):
-        """Create a mocked TvDatafeedLive for consumer testing"""
-        with patch('tvDatafeed.main.create_connection') as mock_ws, \
-             patch('tvDatafeed.main.requests.get') as mock_get:
-            mock_connection = MagicMock()
-            mock_ws.return_value = mock_connection
-            mock_connection.recv.return_value = '~m~52~m~{"m":"qsd","p":["qs_test123",{"n":"symbol_1","s":"ok"}]}'
-
-            # Mock search_symbol
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.text = '[{"symbol": "BINANCE:BTCUSDT", "exchange": "BINANCE", "type": "crypto"}]'
-            mock_get.return_value = mock_response
-
-            tv = TvDatafeedLive()
-            yield tv
-
-            try:
-                tv.del_tvdatafeed()
-            except Exception:
-                pass
-
     def test_create_consumer_with_callback(self, mock_live_tv):
         """Test creating a consumer with a callback function"""
         seis = mock_live_tv.new_seis(
@@ -231,32 +235,10 @@ class TestConsumerManagement:
 
 @pytest.mark.integration
 @pytest.mark.threading
+@pytest.mark.xdist_group("live_feed_thread_safety")
 class TestThreadSafety:
     """Test thread safety of TvDatafeedLive operations"""
 
-    @pytest.fixture
-    def mock_live_tv(self):
-        """Create a mocked TvDatafeedLive for thread safety testing"""
-        with patch('tvDatafeed.main.create_connection') as mock_ws, \
-             patch('tvDatafeed.main.requests.get') as mock_get:
-            mock_connection = MagicMock()
-            mock_ws.return_value = mock_connection
-            mock_connection.recv.return_value = '~m~52~m~{"m":"qsd","p":["qs_test123",{"n":"symbol_1","s":"ok"}]}'
-
-            # Mock search_symbol
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.text = '[{"symbol": "BINANCE:SYM0", "exchange": "BINANCE", "type": "crypto"}]'
-            mock_get.return_value = mock_response
-
-            tv = TvDatafeedLive()
-            yield tv
-
-            try:
-                tv.del_tvdatafeed()
-            except Exception:
-                pass
-
     def test_concurrent_seis_creation(self, mock_live_tv):
         """Test creating SEIS from multiple threads concurrently"""
         seises = []
@@ -304,8 +286,9 @@ class TestThreadSafety:
         # Cleanup
         mock_live_tv.del_tvdatafeed()
 
-        # Wait a bit for cleanup
-        time.sleep(0.5)
+        # Wait for the consumer thread itself rather than a fixed delay
+        consumer.join(timeout=5.0)
+        assert not consumer.is_alive()
 
         # Thread count should not have increased
         final_thread_count = threading.active_count()
@@ -314,32 +297,10 @@ class TestThreadSafety:
 
 @pytest.mark.integration
 @pytest.mark.threading
+@pytest.mark.xdist_group("live_feed_hist")
 class TestHistoricalDataWithLiveFeed:
     """Test getting historical data while live feed is active"""
 
-    @pytest.fixture
-    def mock_live_tv(self):
-        """Create a mocked TvDatafeedLive for historical data testing"""
-        with patch('tvDatafeed.main.create_connection') as mock_ws, \
-             patch('tvDatafeed.main.requests.get') as mock_get:
-            mock_connection = MagicMock()
-            mock_ws.return_value = mock_connection
-            mock_connection.recv.return_value = '~m~52~m~{"m":"qsd","p":["qs_test123",{"n":"symbol_1","s":"ok"}]}'
-
-            # Mock search_symbol
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.text = '[{"symbol": "BINANCE:BTCUSDT", "exchange": "BINANCE", "type": "crypto"}]'
-            mock_get.return_value = mock_response
-
-            tv = TvDatafeedLive()
-            yield tv
-
-            try:
-                tv.del_tvdatafeed()
-            except Exception:
-                pass
-
     def test_get_hist_available(self, mock_live_tv):
         """Test that get_hist method is available on TvDatafeedLive"""
         assert hasattr(mock_live_tv, 'get_hist')
@@ -368,6 +329,7 @@ class TestHistoricalDataWithLiveFeed:
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("live_feed_inheritance")
 class TestLiveFeedInheritance:
     """Test that TvDatafeedLive properly inherits from TvDatafeed"""
 
@@ -376,26 +338,19 @@ class TestLiveFeedInheritance:
         from tvDatafeed import TvDatafeed
         assert issubclass(TvDatafeedLive, TvDatafeed)
 
-    def test_shared_methods(self):
+    @pytest.fixture
+    def search_text(self):
+        """No search results needed for these tests"""
+        return '[]'
+
+    def test_shared_methods(self, mock_live_tv):
         """Test that TvDatafeedLive has all TvDatafeed methods"""
-        with patch('tvDatafeed.main.create_connection') as mock_ws, \
-             patch('tvDatafeed.main.requests.get') as mock_get:
-            mock_connection = MagicMock()
-            mock_ws.return_value = mock_connection
-            mock_connection.recv.return_value = '~m~52~m~{"m":"qsd","p":["qs_test123",{"n":"symbol_1","s":"ok"}]}'
-
-            # Mock search_symbol
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.text = '[]'
-            mock_get.return_value = mock_response
-
-            tv = TvDatafeedLive()
-
-            # Should have base class methods
-            assert hasattr(tv, 'get_hist')
-            assert hasattr(tv, 'search_symbol')
-
-            # And live-specific methods
-            assert hasattr(tv, 'new_seis')
-            assert hasattr(tv, 'new_consumer')
+        tv = mock_live_tv
+
+        # Should have base class methods
+        assert hasattr(tv, 'get_hist')
+        assert hasattr(tv, 'search_symbol')
+
+        # And live-specific methods
+        assert hasattr(tv, 'new_seis')
+        assert hasattr(tv, 'new_consumer')
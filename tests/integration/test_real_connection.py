@@ -10,8 +10,11 @@ Requires .env file with valid credentials.
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -21,29 +24,95 @@ sys.path.insert(0, str(project_root))
 from dotenv import load_dotenv
 load_dotenv(project_root / '.env')
 
-import pandas as pd
+import numpy as np
 from tvDatafeed import TvDatafeed, Interval
+from scripts.token_manager import get_cached_token, is_token_valid, save_cached_token
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass
+class CheckResult:
+    """Outcome of a single real connection check"""
+    test: str
+    status: str
+    message: str
+    duration: float
+
+
+def _ohlc_ok(df: 'pd.DataFrame', chunk: int = 4096) -> bool:
+    """Check high >= low chunk by chunk, stopping at the first violation"""
+    hi = df['high'].to_numpy()
+    lo = df['low'].to_numpy()
+    for i in range(0, len(hi), chunk):
+        if np.any(hi[i:i + chunk] < lo[i:i + chunk]):
+            return False
+    return True
+
+
+class TokenBucket:
+    """Token bucket limiting how fast tests are started"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+
+    def take(self):
+        """Consume one token, sleeping only when the bucket is empty"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens < 1:
+            time.sleep((1 - self.tokens) / self.rate)
+            self.last = time.monotonic()
+            self.tokens = 1.0
+        self.tokens -= 1
 
 
 class RealIntegrationTests:
     """Real integration tests with TradingView"""
 
-    def __init__(self):
+    _BANNER = "=" * 60
+    _SEP = "-" * 100
+
+    # Shared unauthenticated datafeed, created on first use
+    _unauth_tv: Optional[TvDatafeed] = None
+
+    def __init__(self, use_token_cache: bool = True):
+        self.use_token_cache = use_token_cache
         self.username = os.getenv('TV_USERNAME')
         self.password = os.getenv('TV_PASSWORD')
         self.totp_secret = os.getenv('TV_TOTP_SECRET')
-        self.results = []
+        self.results: list[CheckResult] = []
         self.tv = None
+        self.bucket = TokenBucket(rate=2.0, burst=4)
+        self._search_cache = {}
+
+    @classmethod
+    def unauth_tv(cls) -> TvDatafeed:
+        """Return the shared unauthenticated TvDatafeed instance"""
+        if cls._unauth_tv is None:
+            cls._unauth_tv = TvDatafeed()
+        return cls._unauth_tv
+
+    def search_symbol_cached(self, symbol: str, exchange: str = '') -> list:
+        """Search symbols once per (symbol, exchange) for the suite lifetime"""
+        key = (symbol, exchange)
+        if key not in self._search_cache:
+            self._search_cache[key] = self.tv.search_symbol(symbol, exchange)
+        return self._search_cache[key]
+
+    def print_banner(self, title: str):
+        """Print a title between two banner lines in a single write"""
+        print("\n".join(("", self._BANNER, title, self._BANNER)))
 
     def log_result(self, test_name: str, success: bool, message: str, duration: float = 0):
         """Log test result"""
         status = "PASS" if success else "FAIL"
-        self.results.append({
-            'test': test_name,
-            'status': status,
-            'message': message,
-            'duration': round(duration, 2)
-        })
+        self.results.append(CheckResult(test_name, status, message, round(duration, 2)))
         print(f"[{status}] {test_name}: {message} ({duration:.2f}s)")
 
     def test_1_authentication_with_2fa(self) -> bool:
@@ -52,18 +121,24 @@ class RealIntegrationTests:
         start = time.time()
 
         try:
-            print(f"\n{'='*60}")
-            print(f"TEST: {test_name}")
-            print(f"{'='*60}")
+            self.print_banner(f"TEST: {test_name}")
             print(f"Username: {self.username}")
             print(f"TOTP Secret: {'***' + self.totp_secret[-4:] if self.totp_secret else 'None'}")
 
-            self.tv = TvDatafeed(
-                username=self.username,
-                password=self.password,
-                totp_secret=self.totp_secret,
-                verbose=True
-            )
+            # Reuse the token from a previous run while it is still valid
+            cached_token = get_cached_token() if self.use_token_cache else None
+            if cached_token and is_token_valid(cached_token):
+                print("Using cached token (pass --clear-tv-cache to force login)")
+                self.tv = TvDatafeed(auth_token=cached_token, verbose=True)
+            else:
+                self.tv = TvDatafeed(
+                    username=self.username,
+                    password=self.password,
+                    totp_secret=self.totp_secret,
+                    verbose=True
+                )
+                if is_token_valid(self.tv.token):
+                    save_cached_token(self.tv.token)
 
             duration = time.time() - start
 
@@ -85,9 +160,7 @@ class RealIntegrationTests:
         start = time.time()
 
         try:
-            print(f"\n{'='*60}")
-            print(f"TEST: {test_name}")
-            print(f"{'='*60}")
+            self.print_banner(f"TEST: {test_name}")
 
             if not self.tv:
                 self.log_result(test_name, False, "TvDatafeed not initialized", 0)
@@ -112,8 +185,8 @@ class RealIntegrationTests:
                 print(df.tail(3))
 
                 # Validate OHLCV data
-                has_required_cols = all(col in df.columns for col in ['open', 'high', 'low', 'close', 'volume'])
-                valid_ohlc = (df['high'] >= df['low']).all()
+                has_required_cols = {'open', 'high', 'low', 'close', 'volume'}.issubset(df.columns)
+                valid_ohlc = has_required_cols and _ohlc_ok(df)
 
                 if has_required_cols and valid_ohlc:
                     self.log_result(test_name, True, f"Got {len(df)} bars with valid OHLCV data", duration)
@@ -136,9 +209,7 @@ class RealIntegrationTests:
         start = time.time()
 
         try:
-            print(f"\n{'='*60}")
-            print(f"TEST: {test_name}")
-            print(f"{'='*60}")
+            self.print_banner(f"TEST: {test_name}")
 
             if not self.tv:
                 self.log_result(test_name, False, "TvDatafeed not initialized", 0)
@@ -176,9 +247,7 @@ class RealIntegrationTests:
         start = time.time()
 
         try:
-            print(f"\n{'='*60}")
-            print(f"TEST: {test_name}")
-            print(f"{'='*60}")
+            self.print_banner(f"TEST: {test_name}")
 
             if not self.tv:
                 self.log_result(test_name, False, "TvDatafeed not initialized", 0)
@@ -216,9 +285,7 @@ class RealIntegrationTests:
         start = time.time()
 
         try:
-            print(f"\n{'='*60}")
-            print(f"TEST: {test_name}")
-            print(f"{'='*60}")
+            self.print_banner(f"TEST: {test_name}")
 
             if not self.tv:
                 self.log_result(test_name, False, "TvDatafeed not initialized", 0)
@@ -232,25 +299,28 @@ class RealIntegrationTests:
                 (Interval.in_daily, "1D"),
             ]
 
-            results = []
-            for interval, name in intervals_to_test:
+            # TvDatafeed keeps one websocket per instance, so each worker gets
+            # its own datafeed sharing the already-obtained token.
+            def fetch(interval, name):
                 try:
-                    df = self.tv.get_hist(
+                    tv = TvDatafeed(auth_token=self.tv.token)
+                    df = tv.get_hist(
                         symbol='BTCUSDT',
                         exchange='BINANCE',
                         interval=interval,
                         n_bars=10
                     )
                     if df is not None and not df.empty:
-                        results.append((name, True, len(df)))
                         print(f"  [{name}] OK - {len(df)} bars")
-                    else:
-                        results.append((name, False, 0))
-                        print(f"  [{name}] FAIL - No data")
+                        return (name, True, len(df))
+                    print(f"  [{name}] FAIL - No data")
                 except Exception as e:
-                    results.append((name, False, 0))
                     print(f"  [{name}] FAIL - {str(e)}")
-                time.sleep(0.5)  # Small delay between requests
+                return (name, False, 0)
+
+            with ThreadPoolExecutor(max_workers=len(intervals_to_test)) as pool:
+                futures = [pool.submit(fetch, interval, name) for interval, name in intervals_to_test]
+                results = [future.result() for future in as_completed(futures)]
 
             duration = time.time() - start
 
@@ -278,15 +348,13 @@ class RealIntegrationTests:
         start = time.time()
 
         try:
-            print(f"\n{'='*60}")
-            print(f"TEST: {test_name}")
-            print(f"{'='*60}")
+            self.print_banner(f"TEST: {test_name}")
 
             if not self.tv:
                 self.log_result(test_name, False, "TvDatafeed not initialized", 0)
                 return False
 
-            results = self.tv.search_symbol('BTC', 'BINANCE')
+            results = self.search_symbol_cached('BTC', 'BINANCE')
 
             duration = time.time() - start
 
@@ -312,9 +380,7 @@ class RealIntegrationTests:
         start = time.time()
 
         try:
-            print(f"\n{'='*60}")
-            print(f"TEST: {test_name}")
-            print(f"{'='*60}")
+            self.print_banner(f"TEST: {test_name}")
 
             if not self.tv:
                 self.log_result(test_name, False, "TvDatafeed not initialized", 0)
@@ -334,6 +400,9 @@ class RealIntegrationTests:
                 print(f"Date range: {df.index.min()} to {df.index.max()}")
                 print(f"Memory usage: {df.memory_usage(deep=True).sum() / 1024:.2f} KB")
 
+                if not _ohlc_ok(df):
+                    self.log_result(test_name, False, "Invalid OHLC data (high < low)", duration)
+                    return False
                 if len(df) >= 19000:  # Allow some tolerance
                     self.log_result(test_name, True, f"Got {len(df)} bars", duration)
                     return True
@@ -355,12 +424,9 @@ class RealIntegrationTests:
         start = time.time()
 
         try:
-            print(f"\n{'='*60}")
-            print(f"TEST: {test_name}")
-            print(f"{'='*60}")
+            self.print_banner(f"TEST: {test_name}")
 
-            # Create new instance without credentials
-            tv_unauth = TvDatafeed()
+            tv_unauth = self.unauth_tv()
 
             df = tv_unauth.get_hist(
                 symbol='BTCUSDT',
@@ -386,31 +452,33 @@ class RealIntegrationTests:
 
     def generate_report(self):
         """Generate test report"""
-        print(f"\n{'='*60}")
-        print("TEST REPORT - TvDatafeed Real Integration Tests")
-        print(f"{'='*60}")
+        self.print_banner("TEST REPORT - TvDatafeed Real Integration Tests")
         print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*60}\n")
-
-        passed = sum(1 for r in self.results if r['status'] == 'PASS')
-        failed = sum(1 for r in self.results if r['status'] == 'FAIL')
-        total = len(self.results)
-        total_duration = sum(r['duration'] for r in self.results)
+        print(self._BANNER + "\n")
 
         print(f"{'Test Name':<45} {'Status':<8} {'Duration':<10} Message")
-        print("-" * 100)
+        print(self._SEP)
 
+        passed = failed = 0
+        total_duration = 0.0
         for r in self.results:
-            status_icon = "OK" if r['status'] == 'PASS' else "FAIL"
-            print(f"{r['test']:<45} {status_icon:<8} {r['duration']:<10.2f}s {r['message'][:40]}")
+            total_duration += r.duration
+            if r.status == 'PASS':
+                passed += 1
+                status_icon = "OK"
+            else:
+                failed += 1
+                status_icon = "FAIL"
+            print(f"{r.test:<45} {status_icon:<8} {r.duration:<10.2f}s {r.message[:40]}")
+        total = len(self.results)
 
-        print("-" * 100)
+        print(self._SEP)
         print(f"\nSUMMARY:")
         print(f"  Total tests: {total}")
         print(f"  Passed: {passed} ({passed/total*100:.1f}%)")
         print(f"  Failed: {failed} ({failed/total*100:.1f}%)")
         print(f"  Total duration: {total_duration:.2f}s")
-        print(f"\n{'='*60}")
+        print("\n" + self._BANNER)
 
         return passed, failed, total
 
@@ -420,9 +488,7 @@ class RealIntegrationTests:
         start = time.time()
 
         try:
-            print(f"\n{'='*60}")
-            print(f"TEST: {test_name}")
-            print(f"{'='*60}")
+            self.print_banner(f"TEST: {test_name}")
 
             if not self.tv:
                 self.log_result(test_name, False, "TvDatafeed not initialized", 0)
@@ -460,19 +526,17 @@ class RealIntegrationTests:
 
     def run_all_tests(self, skip_auth: bool = False):
         """Run all integration tests"""
-        print("\n" + "="*60)
-        print("STARTING REAL INTEGRATION TESTS")
-        print("="*60)
+        self.print_banner("STARTING REAL INTEGRATION TESTS")
         print(f"Using credentials from .env file")
         print(f"Username: {self.username}")
         print(f"TOTP configured: {'Yes' if self.totp_secret else 'No'}")
         print(f"Skip authentication: {skip_auth}")
-        print("="*60)
+        print(self._BANNER)
 
         if skip_auth:
             # Use unauthenticated access
             print("\nUsing UNAUTHENTICATED access for testing...")
-            self.tv = TvDatafeed()
+            self.tv = self.unauth_tv()
             self.log_result("Authentication with 2FA", False, "SKIPPED - Using unauthenticated mode", 0)
 
             tests = [
@@ -499,11 +563,11 @@ class RealIntegrationTests:
             ]
 
         for test_func in tests:
+            self.bucket.take()  # Avoid rate limiting without idling between every test
             try:
                 test_func()
             except Exception as e:
                 print(f"Unexpected error in {test_func.__name__}: {e}")
-            time.sleep(1)  # Delay between tests to avoid rate limiting
 
         return self.generate_report()
 
@@ -513,9 +577,11 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Run real integration tests for TvDatafeed')
     parser.add_argument('--skip-auth', action='store_true',
                         help='Skip authentication and use unauthenticated access')
+    parser.add_argument('--clear-tv-cache', action='store_true',
+                        help='Ignore the cached token and log in again')
     args = parser.parse_args()
 
-    tests = RealIntegrationTests()
+    tests = RealIntegrationTests(use_token_cache=not args.clear_tv_cache)
     passed, failed, total = tests.run_all_tests(skip_auth=args.skip_auth)
 
     # Exit with error code if any tests failed
@@ -10,43 +10,50 @@ Note: Some tests require valid credentials and may be skipped in CI environments
 """
 
 import os
-import sys
 import json
+import time
+import base64
+import functools
 import pytest
 import tempfile
 from pathlib import Path
-from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+from scripts import token_manager
+from scripts.get_auth_token import decode_jwt_expiry, get_totp_code, save_token_to_env
 
 
 # Sample JWT tokens for testing
+def _b64url(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode('utf-8')).rstrip(b'=').decode('utf-8')
+
+
+_HEADER_ENC = _b64url(json.dumps({"alg": "RS512", "typ": "JWT"}))
+_TV_ENV_KEYS = ('TV_AUTH_TOKEN', 'TV_USERNAME', 'TV_PASSWORD', 'TV_TOTP_SECRET')
+
+
+@functools.lru_cache(maxsize=32)
+def _encode_jwt(payload_json: str) -> str:
+    """Encode a JSON payload string into a fake JWT token"""
+    return f"{_HEADER_ENC}.{_b64url(payload_json)}.fake_signature_for_testing"
+
+
 def create_test_jwt(payload: dict) -> str:
     """Create a fake JWT token from payload"""
-    import base64
-    header = {"alg": "RS512", "typ": "JWT"}
-
-    def encode_part(data):
-        json_bytes = json.dumps(data).encode('utf-8')
-        return base64.urlsafe_b64encode(json_bytes).rstrip(b'=').decode('utf-8')
+    return _encode_jwt(json.dumps(payload))
 
-    header_enc = encode_part(header)
-    payload_enc = encode_part(payload)
-    signature = "fake_signature_for_testing"
 
-    return f"{header_enc}.{payload_enc}.{signature}"
+# Any fixed past exp works for an expired token (2001-09-09)
+_EXPIRED_TOKEN = create_test_jwt({"user_id": 12345, "exp": 1000000000, "iat": 999982000, "plan": "pro"})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_token():
     """Create a valid JWT token"""
     payload = {
         "user_id": 12345,
-        "exp": int((datetime.now() + timedelta(hours=4)).timestamp()),
-        "iat": int(datetime.now().timestamp()),
+        "exp": int(time.time()) + 4 * 3600,
+        "iat": int(time.time()),
         "plan": "pro_premium",
         "perm": "cme,nymex",
         "max_connections": 50
@@ -54,143 +61,133 @@ def valid_token():
     return create_test_jwt(payload)
 
 
+@pytest.fixture(scope="session")
+def cached_token_file(tmp_path_factory, valid_token):
+    """Token cache file holding valid_token, written once for read-only tests"""
+    cache_file = tmp_path_factory.mktemp('token_cache') / '.token_cache.json'
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(token_manager, 'TOKEN_CACHE_FILE', cache_file)
+        token_manager.save_cached_token(valid_token)
+    return cache_file
+
+
+@pytest.fixture
+def tv_env(monkeypatch):
+    """Unset the TV_* variables the token scripts read, restoring them afterwards"""
+    for key in _TV_ENV_KEYS:
+        # setenv first so teardown also drops values load_env() adds later
+        monkeypatch.setenv(key, '')
+        monkeypatch.delenv(key)
+    return monkeypatch
+
+
 @pytest.fixture
 def temp_env_file(tmp_path, valid_token):
     """Create a temporary .env file with test token"""
     env_file = tmp_path / '.env'
-    env_file.write_text(f'''
+    env_file.write_bytes(f'''
 TV_USERNAME=test_user
 TV_PASSWORD=test_password
 TV_TOTP_SECRET=JBSWY3DPEHPK3PXP
 TV_AUTH_TOKEN="{valid_token}"
-''')
+'''.encode('ascii'))
     return env_file
 
 
 class TestTokenManagerIntegration:
     """Integration tests for token_manager module"""
 
-    def test_full_token_lifecycle(self, tmp_path, valid_token):
+    def test_full_token_lifecycle(self, monkeypatch, tmp_path, valid_token):
         """Test the complete token lifecycle: save, cache, retrieve"""
-        from scripts import token_manager
-
         # Setup temporary cache file
         cache_file = tmp_path / '.token_cache.json'
-        original_cache = token_manager.TOKEN_CACHE_FILE
-        token_manager.TOKEN_CACHE_FILE = cache_file
-
-        try:
-            # 1. Save token to cache
-            token_manager.save_cached_token(valid_token)
-            assert cache_file.exists()
-
-            # 2. Verify cache file structure
-            with open(cache_file) as f:
-                data = json.load(f)
-            assert 'token' in data
-            assert 'updated' in data
-            assert 'expiry' in data
-            assert data['token'] == valid_token
-
-            # 3. Retrieve token from cache
-            retrieved = token_manager.get_cached_token()
-            assert retrieved == valid_token
-
-            # 4. Validate the token
-            assert token_manager.is_token_valid(retrieved)
-
-            # 5. Get token info
-            info = token_manager.get_token_info(retrieved)
-            assert info['valid'] is True
-            assert info['plan'] == 'pro_premium'
-            assert info['user_id'] == 12345
-
-        finally:
-            token_manager.TOKEN_CACHE_FILE = original_cache
-
-    def test_token_priority_env_over_cache(self, tmp_path, valid_token):
-        """Test that environment token takes priority over cached token"""
-        from scripts import token_manager
+        monkeypatch.setattr(token_manager, 'TOKEN_CACHE_FILE', cache_file)
+
+        # 1. Save token to cache
+        token_manager.save_cached_token(valid_token)
+        assert cache_file.exists()
+
+        # 2. Verify cache file structure
+        data = json.loads(cache_file.read_bytes())
+        assert 'token' in data
+        assert 'updated' in data
+        assert 'expiry' in data
+        assert data['token'] == valid_token
+
+        # 3. Retrieve token from cache
+        retrieved = token_manager.get_cached_token()
+        assert retrieved == valid_token
 
+        # 4. Validate the token
+        assert token_manager.is_token_valid(retrieved)
+
+        # 5. Get token info
+        info = token_manager.get_token_info(retrieved)
+        assert info['valid'] is True
+        assert info['plan'] == 'pro_premium'
+        assert info['user_id'] == 12345
+
+    def test_token_priority_env_over_cache(self, tv_env, monkeypatch, tmp_path, valid_token):
+        """Test that environment token takes priority over cached token"""
         # Create a different cached token
         cache_token = create_test_jwt({
             "user_id": 99999,
-            "exp": int((datetime.now() + timedelta(hours=2)).timestamp()),
-            "iat": int(datetime.now().timestamp()),
+            "exp": int(time.time()) + 2 * 3600,
+            "iat": int(time.time()),
             "plan": "basic"
         })
 
         cache_file = tmp_path / '.token_cache.json'
-        original_cache = token_manager.TOKEN_CACHE_FILE
-        token_manager.TOKEN_CACHE_FILE = cache_file
+        monkeypatch.setattr(token_manager, 'TOKEN_CACHE_FILE', cache_file)
 
-        try:
-            # Save different token to cache
-            token_manager.save_cached_token(cache_token)
+        # Save different token to cache
+        token_manager.save_cached_token(cache_token)
 
-            # Set env token
-            with patch.dict(os.environ, {'TV_AUTH_TOKEN': valid_token}):
-                # get_valid_token should return env token, not cached
-                token = token_manager.get_valid_token(auto_refresh=False)
-                assert token == valid_token
+        # Set env token
+        tv_env.setenv('TV_AUTH_TOKEN', valid_token)
 
-                info = token_manager.get_token_info(token)
-                assert info['plan'] == 'pro_premium'  # From env token
+        # get_valid_token should return env token, not cached
+        token = token_manager.get_valid_token(auto_refresh=False)
+        assert token == valid_token
 
-        finally:
-            token_manager.TOKEN_CACHE_FILE = original_cache
+        info = token_manager.get_token_info(token)
+        assert info['plan'] == 'pro_premium'  # From env token
 
-    def test_env_loading_integration(self, tmp_path, valid_token):
+    def test_env_loading_integration(self, tv_env, monkeypatch, tmp_path, valid_token):
         """Test loading environment from .env file"""
-        from scripts import token_manager
-
         # Create temp .env file
         env_file = tmp_path / '.env'
-        env_file.write_text(f'''
+        env_file.write_bytes(f'''
 # Test environment file
 TV_USERNAME=integration_test_user
 TV_PASSWORD="test_password_123"
 TV_AUTH_TOKEN='{valid_token}'
-''')
-
-        original_root = token_manager.project_root
-        token_manager.project_root = tmp_path
+'''.encode('ascii'))
 
-        try:
-            # Clear existing env vars
-            with patch.dict(os.environ, {}, clear=True):
-                token_manager.load_env()
+        monkeypatch.setattr(token_manager, 'project_root', tmp_path)
 
-                # Check that values are set (setdefault won't override existing)
-                # In a fresh environment, these would be set
+        # TV_* env vars are cleared by tv_env
+        token_manager.load_env()
 
-        finally:
-            token_manager.project_root = original_root
+        # Check that values are set (setdefault won't override existing)
+        # In a fresh environment, these would be set
 
-    def test_cache_file_permissions(self, tmp_path, valid_token):
+    def test_cache_file_permissions(self, monkeypatch, tmp_path, valid_token):
         """Test that cache file has secure permissions"""
-        from scripts import token_manager
         import stat
 
         cache_file = tmp_path / '.token_cache.json'
-        original_cache = token_manager.TOKEN_CACHE_FILE
-        token_manager.TOKEN_CACHE_FILE = cache_file
+        monkeypatch.setattr(token_manager, 'TOKEN_CACHE_FILE', cache_file)
 
-        try:
-            token_manager.save_cached_token(valid_token)
+        token_manager.save_cached_token(valid_token)
 
-            # On Windows, chmod doesn't work the same way
-            # Just verify the file exists and is readable
-            assert cache_file.exists()
-            assert cache_file.is_file()
+        # On Windows, chmod doesn't work the same way
+        # Just verify the file exists and is readable
+        assert cache_file.exists()
+        assert cache_file.is_file()
 
-            # File should be readable
-            with open(cache_file) as f:
-                data = json.load(f)
-            assert data['token'] == valid_token
-
-        finally:
-            token_manager.TOKEN_CACHE_FILE = original_cache
+        # File should be readable and hold the token
+        assert valid_token.encode('ascii') in cache_file.read_bytes()
 
 
 class TestGetAuthTokenIntegration:
@@ -198,26 +195,24 @@ class TestGetAuthTokenIntegration:
 
     def test_jwt_decoding_consistency(self, valid_token):
         """Test that JWT decoding is consistent between modules"""
-        from scripts.token_manager import decode_jwt, get_token_expiry
-        from scripts.get_auth_token import decode_jwt_expiry
+        # Decode the exp claim once as the reference for both modules
+        payload = valid_token.split('.')[1]
+        exp = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))['exp']
 
-        # Both modules should decode the same expiry
-        tm_expiry = get_token_expiry(valid_token)
+        tm_expiry = token_manager.get_token_expiry(valid_token)
         gat_expiry = decode_jwt_expiry(valid_token)
 
-        # They should be equal (or very close due to timestamp conversion)
+        # They should match the claim (within timestamp conversion)
         assert tm_expiry is not None
         assert gat_expiry is not None
-        assert abs((tm_expiry - gat_expiry).total_seconds()) < 1
+        assert abs(tm_expiry.timestamp() - exp) < 1
+        assert abs(gat_expiry.timestamp() - exp) < 1
 
-    def test_save_and_load_token_integration(self, tmp_path, valid_token):
+    def test_save_and_load_token_integration(self, tv_env, monkeypatch, tmp_path, valid_token):
         """Test saving token via get_auth_token and loading via token_manager"""
-        from scripts.get_auth_token import save_token_to_env
-        from scripts import token_manager
-
         # Create temp .env file
         env_file = tmp_path / '.env'
-        env_file.write_text('TV_USERNAME=test\n')
+        env_file.write_bytes(b'TV_USERNAME=test\n')
 
         original_root_gat = Path(__file__).parent.parent.parent
 
@@ -231,159 +226,116 @@ class TestGetAuthTokenIntegration:
         assert valid_token in content
 
         # Now load it via token_manager
-        with patch.object(token_manager, 'project_root', tmp_path):
-            with patch.dict(os.environ, {}, clear=True):
-                token_manager.load_env()
-                # The token should now be in environment
+        monkeypatch.setattr(token_manager, 'project_root', tmp_path)
+        token_manager.load_env()
+        # The token should now be in environment
 
     def test_totp_generation(self):
         """Test TOTP code generation if pyotp is available"""
-        try:
-            import pyotp
-            from scripts.get_auth_token import get_totp_code
+        pyotp = pytest.importorskip("pyotp")
 
-            # Test with known secret
-            secret = "JBSWY3DPEHPK3PXP"
-            code = get_totp_code(secret)
+        # Test with known secret
+        secret = "JBSWY3DPEHPK3PXP"
+        code = get_totp_code(secret)
 
-            assert code is not None
-            assert len(code) == 6
-            assert code.isdigit()
+        assert code is not None
+        assert len(code) == 6
+        assert code.isdigit()
 
-            # Verify with pyotp directly
-            totp = pyotp.TOTP(secret)
-            assert totp.verify(code)
-
-        except ImportError:
-            pytest.skip("pyotp not installed")
+        # Verify with pyotp directly
+        totp = pyotp.TOTP(secret)
+        assert totp.verify(code)
 
 
 class TestEndToEndWorkflow:
     """End-to-end workflow tests"""
 
-    def test_automated_data_fetch_workflow(self, tmp_path, valid_token):
+    def test_automated_data_fetch_workflow(self, tv_env, monkeypatch, cached_token_file, valid_token):
         """Test the workflow used in automated_data_fetch.py"""
-        from scripts import token_manager
+        # Simulate having a cached token
+        monkeypatch.setattr(token_manager, 'TOKEN_CACHE_FILE', cached_token_file)
 
-        # Setup
-        cache_file = tmp_path / '.token_cache.json'
-        original_cache = token_manager.TOKEN_CACHE_FILE
-        token_manager.TOKEN_CACHE_FILE = cache_file
+        # Workflow: get_valid_token -> get_token_info -> use with TvDatafeed
+        token = token_manager.get_valid_token(auto_refresh=False)
 
-        try:
-            # Simulate having a cached token
-            token_manager.save_cached_token(valid_token)
+        assert token is not None
+        assert token == valid_token
 
-            # Workflow: get_valid_token -> get_token_info -> use with TvDatafeed
-            with patch.dict(os.environ, {}, clear=True):
-                token = token_manager.get_valid_token(auto_refresh=False)
+        info = token_manager.get_token_info(token)
 
-                assert token is not None
-                assert token == valid_token
+        assert info['valid'] is True
+        assert 'plan' in info
+        assert 'expires_at' in info
+        assert 'time_remaining' in info
 
-                info = token_manager.get_token_info(token)
+    def test_token_refresh_workflow_mocked(self, tv_env, monkeypatch, tmp_path, valid_token):
+        """Test the token refresh workflow with mocked Playwright"""
+        cache_file = tmp_path / '.token_cache.json'
+        monkeypatch.setattr(token_manager, 'TOKEN_CACHE_FILE', cache_file)
 
-                assert info['valid'] is True
-                assert 'plan' in info
-                assert 'expires_at' in info
-                assert 'time_remaining' in info
+        # Start with an expired cached token
+        token_manager.save_cached_token(_EXPIRED_TOKEN)
+        tv_env.setenv('TV_USERNAME', 'test')
+        tv_env.setenv('TV_PASSWORD', 'test')
 
-        finally:
-            token_manager.TOKEN_CACHE_FILE = original_cache
+        # Stub the Playwright extraction to return a fresh token
+        monkeypatch.setattr('scripts.get_auth_token.extract_token_playwright', lambda **kwargs: valid_token)
+        monkeypatch.setattr('scripts.get_auth_token.load_env', lambda: None)
 
-    def test_token_refresh_workflow_mocked(self, tmp_path, valid_token):
-        """Test the token refresh workflow with mocked Playwright"""
-        from scripts import token_manager
+        token = token_manager.get_valid_token(auto_refresh=True)
 
-        cache_file = tmp_path / '.token_cache.json'
-        original_cache = token_manager.TOKEN_CACHE_FILE
-        token_manager.TOKEN_CACHE_FILE = cache_file
-
-        try:
-            # Start with an expired cached token
-            expired_token = create_test_jwt({
-                "user_id": 12345,
-                "exp": int((datetime.now() - timedelta(hours=1)).timestamp()),
-                "iat": int((datetime.now() - timedelta(hours=5)).timestamp()),
-                "plan": "pro"
-            })
-            token_manager.save_cached_token(expired_token)
-
-            # Mock the Playwright extraction to return a fresh token
-            with patch('scripts.get_auth_token.extract_token_playwright', return_value=valid_token):
-                with patch('scripts.get_auth_token.load_env'):
-                    with patch.dict(os.environ, {
-                        'TV_USERNAME': 'test',
-                        'TV_PASSWORD': 'test'
-                    }):
-                        token = token_manager.get_valid_token(auto_refresh=True)
-
-                        assert token == valid_token
-                        assert token_manager.is_token_valid(token)
-
-        finally:
-            token_manager.TOKEN_CACHE_FILE = original_cache
+        assert token == valid_token
+        assert token_manager.is_token_valid(token)
 
 
 class TestErrorHandling:
     """Test error handling across modules"""
 
-    def test_corrupted_cache_recovery(self, tmp_path, valid_token):
+    def test_corrupted_cache_recovery(self, monkeypatch, tmp_path, valid_token):
         """Test recovery from corrupted cache file"""
-        from scripts import token_manager
-
         cache_file = tmp_path / '.token_cache.json'
-        original_cache = token_manager.TOKEN_CACHE_FILE
-        token_manager.TOKEN_CACHE_FILE = cache_file
-
-        try:
-            # Write corrupted data
-            cache_file.write_text('not valid json {{{')
+        monkeypatch.setattr(token_manager, 'TOKEN_CACHE_FILE', cache_file)
 
-            # Should return None gracefully
-            token = token_manager.get_cached_token()
-            assert token is None
+        # Write corrupted data
+        cache_file.write_bytes(b'not valid json {{{')
 
-            # Should be able to save new token
-            token_manager.save_cached_token(valid_token)
+        # Should return None gracefully
+        token = token_manager.get_cached_token()
+        assert token is None
 
-            # Should now retrieve correctly
-            token = token_manager.get_cached_token()
-            assert token == valid_token
+        # Should be able to save new token
+        token_manager.save_cached_token(valid_token)
 
-        finally:
-            token_manager.TOKEN_CACHE_FILE = original_cache
+        # Should now retrieve correctly
+        token = token_manager.get_cached_token()
+        assert token == valid_token
 
-    def test_missing_env_file_handling(self, tmp_path):
+    def test_missing_env_file_handling(self, monkeypatch, tmp_path):
         """Test handling of missing .env file"""
-        from scripts import token_manager
-
         # Point to non-existent directory
         non_existent = tmp_path / 'does_not_exist'
 
-        with patch.object(token_manager, 'project_root', non_existent):
-            # Should not raise, just skip loading
-            token_manager.load_env()
-
-    def test_invalid_token_handling(self):
+        monkeypatch.setattr(token_manager, 'project_root', non_existent)
+        # Should not raise, just skip loading
+        token_manager.load_env()
+
+    @pytest.mark.parametrize("token", [
+        None,
+        "",
+        "not-a-jwt",
+        "only.two.parts.not.three.parts",
+        "invalid.base64.here",
+    ])
+    def test_invalid_token_handling(self, token, tv_env, monkeypatch, tmp_path):
         """Test handling of various invalid tokens"""
-        from scripts.token_manager import get_token_info, is_token_valid
-
-        invalid_tokens = [
-            None,
-            "",
-            "not-a-jwt",
-            "only.two.parts.not.three.parts",
-            "invalid.base64.here",
-        ]
-
-        for token in invalid_tokens:
-            info = get_token_info(token) if token else get_token_info()
-            if token:
-                assert info['valid'] is False or 'error' in info
-
-            if token:
-                assert is_token_valid(token) is False
+        # No .env file, cache file or TV_AUTH_TOKEN to fall back on
+        monkeypatch.setattr(token_manager, 'project_root', tmp_path)
+        monkeypatch.setattr(token_manager, 'TOKEN_CACHE_FILE', tmp_path / '.token_cache.json')
+
+        info = token_manager.get_token_info(token)
+        assert info['valid'] is False
+        assert 'error' in info
+        assert token_manager.is_token_valid(token) is False
 
 
 @pytest.mark.skipif(
@@ -5,37 +5,102 @@ Tests the TradingViewAuth class that implements HTTP-based authentication
 to bypass reCAPTCHA and handle 2FA automatically.
 """
 
+import sys
 import pytest
 import platform
 from unittest.mock import Mock, patch, MagicMock
-from http.cookiejar import Cookie
+from types import SimpleNamespace
 import requests
+from requests.cookies import RequestsCookieJar
 
 from tvDatafeed.auth import TradingViewAuth
 from tvDatafeed.exceptions import AuthenticationError
 
 
-def create_mock_cookie(name, value):
-    """Helper to create a properly formatted mock cookie"""
-    return Cookie(
-        version=0, name=name, value=value,
-        port=None, port_specified=False,
-        domain='tradingview.com', domain_specified=False, domain_initial_dot=False,
-        path='/', path_specified=True,
-        secure=True, expires=None, discard=True,
-        comment=None, comment_url=None, rest={}, rfc2109=False
-    )
-
-
 def create_mock_cookiejar(**cookies):
-    """Helper to create a mock cookiejar with cookies"""
-    from http.cookiejar import CookieJar
-    jar = CookieJar()
+    """Helper to create a cookiejar with cookies"""
+    jar = RequestsCookieJar()
     for name, value in cookies.items():
-        jar.set_cookie(create_mock_cookie(name, value))
+        jar.set(name, value, domain='tradingview.com', path='/')
     return jar
 
 
+# Login responses only read cookies, so these jars are shared between tests
+_EMPTY_JAR = create_mock_cookiejar()
+_SESSION_JAR = create_mock_cookiejar(sessionid='test_session', sessionid_sign='test_sign')
+
+_SIGNIN_URL = "https://www.tradingview.com/accounts/signin/"
+_TOTP_URL = "https://www.tradingview.com/accounts/two-factor/signin/totp/"
+_HOME_URL = "https://www.tradingview.com/"
+
+_2FA_REQUIRED = {"error": "2FA_required", "code": "2FA_required"}
+_NOT_JSON = object()
+
+
+def make_response(status=200, text="", json_data=_NOT_JSON, cookies=_EMPTY_JAR, headers=None):
+    """Helper to create a canned HTTP response
+
+    json() raises ValueError like an HTML page unless json_data is given.
+    """
+    def _json():
+        if json_data is _NOT_JSON:
+            raise ValueError("Not JSON")
+        return json_data
+
+    return SimpleNamespace(
+        status_code=status,
+        text=text,
+        json=_json,
+        cookies=cookies,
+        headers=headers if headers is not None else {},
+    )
+
+
+# Non-JSON 200 reply without cookies, shared since the code under test only reads it
+_EMPTY_RESPONSE = make_response()
+
+
+def _blocked_send(*args, **kwargs):
+    raise RuntimeError("Network access blocked in auth unit tests")
+
+
+@pytest.fixture(autouse=True)
+def _no_network(monkeypatch):
+    """Fail loudly if a request slips past the session mocks"""
+    monkeypatch.setattr('requests.adapters.HTTPAdapter.send', _blocked_send)
+
+
+@pytest.fixture(scope="module")
+def auth():
+    """TradingViewAuth shared by tests that only patch its HTTP calls"""
+    return TradingViewAuth()
+
+
+@pytest.fixture
+def mock_post(auth, monkeypatch):
+    """Mock standing in for the shared auth session's post()"""
+    mock = Mock()
+    monkeypatch.setattr(auth.session, 'post', mock)
+    return mock
+
+
+@pytest.fixture
+def fake_pyotp(monkeypatch):
+    """Stand-in pyotp module for the import inside login_user's 2FA branch"""
+    module = Mock()
+    module.TOTP.return_value.now.return_value = "123456"
+    monkeypatch.setitem(sys.modules, 'pyotp', module)
+    return module
+
+
+@pytest.fixture
+def mock_get(auth, monkeypatch):
+    """Mock standing in for the shared auth session's get()"""
+    mock = Mock()
+    monkeypatch.setattr(auth.session, 'get', mock)
+    return mock
+
+
 class TestTradingViewAuth:
     """Test suite for TradingViewAuth class"""
 
@@ -57,9 +122,8 @@ class TestTradingViewAuth:
 
         assert auth.user_agent == custom_ua
 
-    def test_generate_user_agent(self):
+    def test_generate_user_agent(self, auth):
         """Test user agent generation"""
-        auth = TradingViewAuth()
         user_agent = auth._generate_user_agent()
 
         assert user_agent.startswith("TWAPI/3.0")
@@ -67,6 +131,12 @@ class TestTradingViewAuth:
         assert ")" in user_agent
         assert ";" in user_agent
 
+    def test_session_connection_pool(self, auth):
+        """Test the session mounts a sized HTTPS connection pool"""
+        adapter = auth.session.get_adapter('https://www.tradingview.com/')
+
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 10
+
     def test_gen_auth_cookies_empty(self):
         """Test cookie generation with empty session_id"""
         result = TradingViewAuth.gen_auth_cookies(session_id="")
@@ -94,22 +164,13 @@ class TestTradingViewAuth:
 class TestTradingViewAuthLogin:
     """Test suite for login_user method"""
 
-    @patch('tvDatafeed.auth.requests.Session.post')
-    def test_login_success_no_2fa(self, mock_post):
+    def test_login_success_no_2fa(self, mock_post, auth):
         """Test successful login without 2FA"""
         # Mock successful login response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = "HTML response"
-        mock_response.json.side_effect = ValueError("Not JSON")
-        mock_response.cookies = create_mock_cookiejar(
-            sessionid='test_session',
-            sessionid_sign='test_sign'
-        )
+        mock_response = make_response(text="HTML response", cookies=_SESSION_JAR)
         mock_post.return_value = mock_response
 
         # Mock get_user to return user data
-        auth = TradingViewAuth()
         with patch.object(auth, 'get_user') as mock_get_user:
             mock_get_user.return_value = {
                 'id': 12345,
@@ -135,21 +196,12 @@ class TestTradingViewAuthLogin:
             assert result['session'] == 'test_session'
             assert result['signature'] == 'test_sign'
 
-    @patch('tvDatafeed.auth.requests.Session.post')
-    def test_login_2fa_required(self, mock_post):
+    def test_login_2fa_required(self, mock_post, auth):
         """Test login when 2FA is required"""
         # Mock 2FA required response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"error": "2FA_required", "code": "2FA_required"}
-        mock_response.cookies = create_mock_cookiejar(
-            sessionid='test_session',
-            sessionid_sign='test_sign'
-        )
+        mock_response = make_response(json_data=_2FA_REQUIRED, cookies=_SESSION_JAR)
         mock_post.return_value = mock_response
 
-        auth = TradingViewAuth()
-
         # Should raise AuthenticationError when no TOTP secret provided
         with pytest.raises(AuthenticationError, match="2FA required but no TOTP secret provided"):
             auth.login_user(
@@ -157,34 +209,15 @@ class TestTradingViewAuthLogin:
                 password="testpass"
             )
 
-    @patch('pyotp.TOTP')
-    @patch('tvDatafeed.auth.requests.Session.post')
-    def test_login_2fa_success(self, mock_post, mock_totp):
+    def test_login_2fa_success(self, fake_pyotp, mock_post, auth):
         """Test successful login with 2FA"""
         # Mock initial login response requiring 2FA
-        initial_response = Mock()
-        initial_response.status_code = 200
-        initial_response.json.return_value = {"error": "2FA_required", "code": "2FA_required"}
-        initial_response.cookies = create_mock_cookiejar(
-            sessionid='test_session',
-            sessionid_sign='test_sign'
-        )
-
-        # Mock 2FA submission response
-        totp_response = Mock()
-        totp_response.status_code = 200
-        totp_response.json.side_effect = ValueError("Not JSON - success")
-        totp_response.cookies = create_mock_cookiejar()
-
-        mock_post.side_effect = [initial_response, totp_response]
+        initial_response = make_response(json_data=_2FA_REQUIRED, cookies=_SESSION_JAR)
 
-        # Mock TOTP code generation
-        mock_totp_instance = Mock()
-        mock_totp_instance.now.return_value = "123456"
-        mock_totp.return_value = mock_totp_instance
+        # 2FA submission succeeds with a plain response
+        mock_post.side_effect = [initial_response, _EMPTY_RESPONSE]
 
         # Mock get_user
-        auth = TradingViewAuth()
         with patch.object(auth, 'get_user') as mock_get_user:
             mock_get_user.return_value = {
                 'id': 12345,
@@ -199,44 +232,32 @@ class TestTradingViewAuthLogin:
             )
 
             # Verify TOTP was called
-            assert mock_totp.called
-            assert mock_totp_instance.now.called
+            assert fake_pyotp.TOTP.called
+            assert fake_pyotp.TOTP.return_value.now.called
 
             # Verify result
             assert result['username'] == 'testuser'
             assert result['authToken'] == 'test_token_with_2fa'
 
-    @patch('tvDatafeed.auth.requests.Session.post')
-    def test_login_invalid_credentials(self, mock_post):
+    def test_login_invalid_credentials(self, mock_post, auth):
         """Test login with invalid credentials"""
         # Mock error response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = make_response(json_data={
             "error": "invalid_credentials",
             "code": "invalid_credentials"
-        }
+        })
         mock_post.return_value = mock_response
 
-        auth = TradingViewAuth()
-
         with pytest.raises(AuthenticationError, match="invalid_credentials"):
             auth.login_user(
                 username="wronguser",
                 password="wrongpass"
             )
 
-    @patch('tvDatafeed.auth.requests.Session.post')
-    def test_login_no_session_cookie(self, mock_post):
+    def test_login_no_session_cookie(self, mock_post, auth):
         """Test login when no session cookie is returned"""
         # Mock response without session cookie
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Not JSON")
-        mock_response.cookies = create_mock_cookiejar()  # No sessionid!
-        mock_post.return_value = mock_response
-
-        auth = TradingViewAuth()
+        mock_post.return_value = _EMPTY_RESPONSE  # No sessionid!
 
         with pytest.raises(AuthenticationError, match="No session cookie received"):
             auth.login_user(
@@ -244,29 +265,21 @@ class TestTradingViewAuthLogin:
                 password="testpass"
             )
 
-    @patch('tvDatafeed.auth.requests.Session.post')
-    def test_login_request_exception(self, mock_post):
+    def test_login_request_exception(self, mock_post, auth):
         """Test login when request fails"""
         mock_post.side_effect = requests.RequestException("Connection error")
 
-        auth = TradingViewAuth()
-
         with pytest.raises(AuthenticationError, match="Login request failed"):
             auth.login_user(
                 username="testuser",
                 password="testpass"
             )
 
-    @patch('tvDatafeed.auth.requests.Session.post')
-    def test_login_without_remember(self, mock_post):
+    def test_login_without_remember(self, mock_post, auth):
         """Test login without remember flag"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Not JSON")
-        mock_response.cookies = create_mock_cookiejar(sessionid='test_session')
+        mock_response = make_response(cookies=create_mock_cookiejar(sessionid='test_session'))
         mock_post.return_value = mock_response
 
-        auth = TradingViewAuth()
         with patch.object(auth, 'get_user') as mock_get_user:
             mock_get_user.return_value = {
                 'authToken': 'test_token'
@@ -286,17 +299,11 @@ class TestTradingViewAuthLogin:
 class TestTradingViewAuthSubmit2FA:
     """Test suite for _submit_2fa method"""
 
-    @patch('tvDatafeed.auth.requests.Session.post')
-    def test_submit_2fa_success(self, mock_post):
+    def test_submit_2fa_success(self, mock_post, auth):
         """Test successful 2FA submission"""
         # Mock successful 2FA response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Not JSON - success")
-        mock_response.cookies = create_mock_cookiejar()
-        mock_post.return_value = mock_response
+        mock_post.return_value = _EMPTY_RESPONSE
 
-        auth = TradingViewAuth()
         with patch.object(auth, 'get_user') as mock_get_user:
             mock_get_user.return_value = {
                 'id': 12345,
@@ -320,19 +327,14 @@ class TestTradingViewAuthSubmit2FA:
             assert result['session'] == 'test_session'
             assert result['signature'] == 'test_sign'
 
-    @patch('tvDatafeed.auth.requests.Session.post')
-    def test_submit_2fa_invalid_code(self, mock_post):
+    def test_submit_2fa_invalid_code(self, mock_post, auth):
         """Test 2FA submission with invalid code"""
         # Mock error response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response = make_response(json_data={
             "error": "Invalid code"
-        }
+        })
         mock_post.return_value = mock_response
 
-        auth = TradingViewAuth()
-
         with pytest.raises(AuthenticationError, match="2FA verification failed"):
             auth._submit_2fa(
                 session_id="test_session",
@@ -340,20 +342,15 @@ class TestTradingViewAuthSubmit2FA:
                 totp_code="000000"
             )
 
-    @patch('tvDatafeed.auth.requests.Session.post')
-    def test_submit_2fa_updated_cookies(self, mock_post):
+    def test_submit_2fa_updated_cookies(self, mock_post, auth):
         """Test 2FA submission with updated session cookies"""
         # Mock response with updated cookies
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Not JSON")
-        mock_response.cookies = create_mock_cookiejar(
+        mock_response = make_response(cookies=create_mock_cookiejar(
             sessionid='new_session',
             sessionid_sign='new_sign'
-        )
+        ))
         mock_post.return_value = mock_response
 
-        auth = TradingViewAuth()
         with patch.object(auth, 'get_user') as mock_get_user:
             mock_get_user.return_value = {
                 'authToken': 'test_token'
@@ -369,13 +366,10 @@ class TestTradingViewAuthSubmit2FA:
             assert result['session'] == 'new_session'
             assert result['signature'] == 'new_sign'
 
-    @patch('tvDatafeed.auth.requests.Session.post')
-    def test_submit_2fa_request_exception(self, mock_post):
+    def test_submit_2fa_request_exception(self, mock_post, auth):
         """Test 2FA submission when request fails"""
         mock_post.side_effect = requests.RequestException("Network error")
 
-        auth = TradingViewAuth()
-
         with pytest.raises(AuthenticationError, match="2FA request failed"):
             auth._submit_2fa(
                 session_id="test_session",
@@ -387,8 +381,7 @@ class TestTradingViewAuthSubmit2FA:
 class TestTradingViewAuthGetUser:
     """Test suite for get_user method"""
 
-    @patch('tvDatafeed.auth.requests.Session.get')
-    def test_get_user_success(self, mock_get):
+    def test_get_user_success(self, mock_get, auth):
         """Test successful user data retrieval"""
         # Mock HTML response with user data (format that matches the regex patterns)
         html_response = '''
@@ -400,13 +393,9 @@ class TestTradingViewAuthGetUser:
             </script>
         </html>
         '''
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = html_response
-        mock_response.headers = {}
+        mock_response = make_response(text=html_response)
         mock_get.return_value = mock_response
 
-        auth = TradingViewAuth()
         result = auth.get_user(
             session_id="test_session",
             signature="test_sign"
@@ -424,18 +413,12 @@ class TestTradingViewAuthGetUser:
         assert result['authToken'] == "eyJhbGciOiJSUzUxMiJ9.test_token"
         assert result['joinDate'] == "2020-01-01"
 
-    @patch('tvDatafeed.auth.requests.Session.get')
-    def test_get_user_no_auth_token(self, mock_get):
+    def test_get_user_no_auth_token(self, mock_get, auth):
         """Test get_user when auth_token is not in HTML"""
-        mock_response = Mock()
-        mock_response.status_code = 200
         # HTML without the substring 'auth_token'
-        mock_response.text = "<html><body>Invalid or expired session</body></html>"
-        mock_response.headers = {}
+        mock_response = make_response(text="<html><body>Invalid or expired session</body></html>")
         mock_get.return_value = mock_response
 
-        auth = TradingViewAuth()
-
         # The code checks for 'auth_token' substring in HTML
         # This HTML doesn't contain that substring, so should raise error
         with pytest.raises(AuthenticationError, match="Wrong or expired sessionid/signature"):
@@ -444,26 +427,21 @@ class TestTradingViewAuthGetUser:
                 signature="invalid_sign"
             )
 
-    @patch('tvDatafeed.auth.requests.Session.get')
-    def test_get_user_redirect(self, mock_get):
+    def test_get_user_redirect(self, mock_get, auth):
         """Test get_user with redirect"""
         # First response with redirect
-        redirect_response = Mock()
-        redirect_response.status_code = 302
-        redirect_response.headers = {'location': 'https://www.tradingview.com/redirect'}
-        redirect_response.text = ""
+        redirect_response = make_response(
+            status=302,
+            headers={'location': 'https://www.tradingview.com/redirect'}
+        )
 
         # Second response after redirect
-        final_response = Mock()
-        final_response.status_code = 200
-        final_response.text = '''
+        final_response = make_response(text='''
         <html><script>{"auth_token":"test_token","id":123}</script></html>
-        '''
-        final_response.headers = {}
+        ''')
 
         mock_get.side_effect = [redirect_response, final_response]
 
-        auth = TradingViewAuth()
         result = auth.get_user(
             session_id="test_session",
             signature="test_sign"
@@ -473,8 +451,7 @@ class TestTradingViewAuthGetUser:
         assert mock_get.call_count == 2
         assert result['authToken'] == "test_token"
 
-    @patch('tvDatafeed.auth.requests.Session.get')
-    def test_get_user_missing_fields(self, mock_get):
+    def test_get_user_missing_fields(self, mock_get, auth):
         """Test get_user with missing optional fields"""
         html_response = '''
         <html>
@@ -483,13 +460,9 @@ class TestTradingViewAuthGetUser:
             </script>
         </html>
         '''
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = html_response
-        mock_response.headers = {}
+        mock_response = make_response(text=html_response)
         mock_get.return_value = mock_response
 
-        auth = TradingViewAuth()
         result = auth.get_user(
             session_id="test_session",
             signature="test_sign"
@@ -505,29 +478,21 @@ class TestTradingViewAuthGetUser:
         assert result['following'] == 0
         assert result['followers'] == 0
 
-    @patch('tvDatafeed.auth.requests.Session.get')
-    def test_get_user_request_exception(self, mock_get):
+    def test_get_user_request_exception(self, mock_get, auth):
         """Test get_user when request fails"""
         mock_get.side_effect = requests.RequestException("Connection failed")
 
-        auth = TradingViewAuth()
-
         with pytest.raises(AuthenticationError, match="Failed to get user data"):
             auth.get_user(
                 session_id="test_session",
                 signature="test_sign"
             )
 
-    @patch('tvDatafeed.auth.requests.Session.get')
-    def test_get_user_custom_location(self, mock_get):
+    def test_get_user_custom_location(self, mock_get, auth):
         """Test get_user with custom location URL"""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = '<html><script>{"auth_token":"test_custom_token"}</script></html>'
-        mock_response.headers = {}
+        mock_response = make_response(text='<html><script>{"auth_token":"test_custom_token"}</script></html>')
         mock_get.return_value = mock_response
 
-        auth = TradingViewAuth()
         custom_url = "https://www.tradingview.com/custom"
 
         result = auth.get_user(
@@ -546,54 +511,32 @@ class TestTradingViewAuthGetUser:
 class TestTradingViewAuthIntegration:
     """Integration tests for complete authentication flows"""
 
-    @patch('pyotp.TOTP')
-    @patch('tvDatafeed.auth.requests.Session.post')
-    @patch('tvDatafeed.auth.requests.Session.get')
-    def test_full_login_flow_with_2fa(self, mock_get, mock_post, mock_totp):
+    def test_full_login_flow_with_2fa(self, fake_pyotp, mock_get, mock_post, auth):
         """Test complete login flow with 2FA"""
-        # Mock initial login response (2FA required)
-        login_response = Mock()
-        login_response.status_code = 200
-        login_response.json.return_value = {"error": "2FA_required", "code": "2FA_required"}
-        login_response.cookies = create_mock_cookiejar(
-            sessionid='sess123',
-            sessionid_sign='sign456'
-        )
-
-        # Mock 2FA submission response
-        totp_response = Mock()
-        totp_response.status_code = 200
-        totp_response.json.side_effect = ValueError("Not JSON")
-        totp_response.cookies = create_mock_cookiejar()
-
-        mock_post.side_effect = [login_response, totp_response]
-
-        # Mock TOTP
-        mock_totp_instance = Mock()
-        mock_totp_instance.now.return_value = "123456"
-        mock_totp.return_value = mock_totp_instance
-
-        # Mock get_user response
         user_html = '''
         <html><script>{"auth_token":"final_token_123","id":999,"username":"user"}</script></html>
         '''
-        user_response = Mock()
-        user_response.status_code = 200
-        user_response.text = user_html
-        user_response.headers = {}
-        mock_get.return_value = user_response
+        # Canned responses keyed by URL, as TradingView would serve them
+        routes = {
+            _SIGNIN_URL: make_response(json_data=_2FA_REQUIRED, cookies=create_mock_cookiejar(
+                sessionid='sess123',
+                sessionid_sign='sign456'
+            )),
+            _TOTP_URL: _EMPTY_RESPONSE,
+            _HOME_URL: make_response(text=user_html),
+        }
+        mock_post.side_effect = mock_get.side_effect = lambda url, **kwargs: routes[url]
 
         # Execute full login
-        auth = TradingViewAuth()
         result = auth.login_user(
             username="testuser",
             password="testpass",
             totp_secret="JBSWY3DPEHPK3PXP"
         )
 
-        # Verify complete flow
-        assert mock_post.call_count == 2  # Login + 2FA
-        assert mock_get.call_count == 1   # Get user data
+        # Verify complete flow: login + 2FA posts, then the user data fetch
+        assert [c.args[0] for c in mock_post.call_args_list] == [_SIGNIN_URL, _TOTP_URL]
+        assert [c.args[0] for c in mock_get.call_args_list] == [_HOME_URL]
         assert result['session'] == 'sess123'
         assert result['signature'] == 'sign456'
         assert result['authToken'] == 'final_token_123'
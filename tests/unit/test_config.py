@@ -30,28 +30,6 @@ class TestNetworkConfig:
         assert config.max_retry_delay == 60.0
         assert config.requests_per_minute == 60
 
-    def test_network_config_from_env(self, monkeypatch):
-        """Test NetworkConfig.from_env()"""
-        monkeypatch.setenv('TV_WS_URL', 'wss://custom.url/ws')
-        monkeypatch.setenv('TV_CONNECT_TIMEOUT', '20.0')
-        monkeypatch.setenv('TV_SEND_TIMEOUT', '10.0')
-        monkeypatch.setenv('TV_RECV_TIMEOUT', '60.0')
-        monkeypatch.setenv('TV_MAX_RETRIES', '5')
-        monkeypatch.setenv('TV_BASE_RETRY_DELAY', '5.0')
-        monkeypatch.setenv('TV_MAX_RETRY_DELAY', '120.0')
-        monkeypatch.setenv('TV_REQUESTS_PER_MINUTE', '30')
-
-        config = NetworkConfig.from_env()
-
-        assert config.ws_url == 'wss://custom.url/ws'
-        assert config.connect_timeout == 20.0
-        assert config.send_timeout == 10.0
-        assert config.recv_timeout == 60.0
-        assert config.max_retries == 5
-        assert config.base_retry_delay == 5.0
-        assert config.max_retry_delay == 120.0
-        assert config.requests_per_minute == 30
-
 
 @pytest.mark.unit
 class TestAuthConfig:
@@ -66,18 +44,6 @@ class TestAuthConfig:
         assert config.password is None
         assert config.two_factor_code is None
 
-    def test_auth_config_from_env(self, monkeypatch):
-        """Test AuthConfig.from_env()"""
-        monkeypatch.setenv('TV_USERNAME', 'testuser')
-        monkeypatch.setenv('TV_PASSWORD', 'testpass')
-        monkeypatch.setenv('TV_2FA_CODE', '123456')
-
-        config = AuthConfig.from_env()
-
-        assert config.username == 'testuser'
-        assert config.password == 'testpass'
-        assert config.two_factor_code == '123456'
-
 
 @pytest.mark.unit
 class TestDataConfig:
@@ -93,22 +59,6 @@ class TestDataConfig:
         assert config.fill_missing_volume == 'zero'
         assert config.timezone == 'UTC'
 
-    def test_data_config_from_env(self, monkeypatch):
-        """Test DataConfig.from_env()"""
-        monkeypatch.setenv('TV_MAX_BARS', '1000')
-        monkeypatch.setenv('TV_DEFAULT_BARS', '50')
-        monkeypatch.setenv('TV_VALIDATE_DATA', 'false')
-        monkeypatch.setenv('TV_FILL_MISSING_VOLUME', 'forward')
-        monkeypatch.setenv('TV_TIMEZONE', 'America/New_York')
-
-        config = DataConfig.from_env()
-
-        assert config.max_bars == 1000
-        assert config.default_bars == 50
-        assert config.validate_data is False
-        assert config.fill_missing_volume == 'forward'
-        assert config.timezone == 'America/New_York'
-
 
 @pytest.mark.unit
 class TestThreadingConfig:
@@ -122,18 +72,6 @@ class TestThreadingConfig:
         assert config.retry_sleep == 0.1
         assert config.shutdown_timeout == 10.0
 
-    def test_threading_config_from_env(self, monkeypatch):
-        """Test ThreadingConfig.from_env()"""
-        monkeypatch.setenv('TV_RETRY_LIMIT', '100')
-        monkeypatch.setenv('TV_RETRY_SLEEP', '0.5')
-        monkeypatch.setenv('TV_SHUTDOWN_TIMEOUT', '30.0')
-
-        config = ThreadingConfig.from_env()
-
-        assert config.retry_limit == 100
-        assert config.retry_sleep == 0.5
-        assert config.shutdown_timeout == 30.0
-
 
 @pytest.mark.unit
 class TestTvDatafeedConfig:
@@ -177,21 +115,91 @@ class TestTvDatafeedConfig:
         assert isinstance(DEFAULT_CONFIG, TvDatafeedConfig)
 
 
+_FROM_ENV_CASES = [
+    pytest.param(
+        NetworkConfig,
+        {
+            'TV_WS_URL': 'wss://custom.url/ws',
+            'TV_CONNECT_TIMEOUT': '20.0',
+            'TV_SEND_TIMEOUT': '10.0',
+            'TV_RECV_TIMEOUT': '60.0',
+            'TV_MAX_RETRIES': '5',
+            'TV_BASE_RETRY_DELAY': '5.0',
+            'TV_MAX_RETRY_DELAY': '120.0',
+            'TV_REQUESTS_PER_MINUTE': '30',
+        },
+        {
+            'ws_url': 'wss://custom.url/ws',
+            'connect_timeout': 20.0,
+            'send_timeout': 10.0,
+            'recv_timeout': 60.0,
+            'max_retries': 5,
+            'base_retry_delay': 5.0,
+            'max_retry_delay': 120.0,
+            'requests_per_minute': 30,
+        },
+        id='network',
+    ),
+    pytest.param(
+        AuthConfig,
+        {'TV_USERNAME': 'testuser', 'TV_PASSWORD': 'testpass', 'TV_2FA_CODE': '123456'},
+        {'username': 'testuser', 'password': 'testpass', 'two_factor_code': '123456'},
+        id='auth',
+    ),
+    pytest.param(
+        DataConfig,
+        {
+            'TV_MAX_BARS': '1000',
+            'TV_DEFAULT_BARS': '50',
+            'TV_VALIDATE_DATA': 'false',
+            'TV_FILL_MISSING_VOLUME': 'forward',
+            'TV_TIMEZONE': 'America/New_York',
+        },
+        {
+            'max_bars': 1000,
+            'default_bars': 50,
+            'validate_data': False,
+            'fill_missing_volume': 'forward',
+            'timezone': 'America/New_York',
+        },
+        id='data',
+    ),
+    pytest.param(
+        ThreadingConfig,
+        {'TV_RETRY_LIMIT': '100', 'TV_RETRY_SLEEP': '0.5', 'TV_SHUTDOWN_TIMEOUT': '30.0'},
+        {'retry_limit': 100, 'retry_sleep': 0.5, 'shutdown_timeout': 30.0},
+        id='threading',
+    ),
+    # Only some env vars set: the rest keep their defaults
+    pytest.param(
+        NetworkConfig,
+        {'TV_MAX_RETRIES': '10'},
+        {'max_retries': 10, 'connect_timeout': 10.0, 'send_timeout': 5.0},
+        id='network-partial',
+    ),
+]
+
+
 @pytest.mark.unit
-class TestConfigPartialEnv:
-    """Test config with partial environment variables"""
+class TestConfigFromEnv:
+    """Test from_env() of the individual config sections"""
 
-    def test_network_config_partial_env(self, monkeypatch):
-        """Test NetworkConfig with only some env vars set"""
-        monkeypatch.setenv('TV_MAX_RETRIES', '10')
+    @pytest.mark.parametrize("config_cls,env,expected", _FROM_ENV_CASES)
+    def test_from_env(self, monkeypatch, config_cls, env, expected):
+        """Test that from_env() reads each variable into its attribute"""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
 
-        config = NetworkConfig.from_env()
+        config = config_cls.from_env()
 
-        # Custom value from env
-        assert config.max_retries == 10
-        # Default values for others
-        assert config.connect_timeout == 10.0
-        assert config.send_timeout == 5.0
+        for attr, value in expected.items():
+            actual = getattr(config, attr)
+            assert (actual, type(actual)) == (value, type(value)), attr
+
+
+@pytest.mark.unit
+class TestConfigPartialEnv:
+    """Test config with partial environment variables"""
 
     def test_data_config_validate_data_true(self, monkeypatch):
         """Test DataConfig validate_data true value"""
@@ -351,6 +351,30 @@ class TestSeisesAndTrigger:
 
         assert '1H' not in sat.intervals()
 
+    def test_sat_discard_clears_get_seis(self):
+        """Test get_seis returns None once the Seis is discarded"""
+        sat = TvDatafeedLive._SeisesAndTrigger()
+        seis = Seis('BTCUSDT', 'BINANCE', Interval.in_1_hour)
+        sat.append(seis, datetime.now())
+
+        sat.discard(seis)
+
+        assert sat.get_seis('BTCUSDT', 'BINANCE', Interval.in_1_hour) is None
+
+    def test_sat_discard_moves_get_seis_to_remaining_duplicate(self):
+        """Test get_seis falls back to an equal Seis left in the list"""
+        sat = TvDatafeedLive._SeisesAndTrigger()
+        seis1 = Seis('BTCUSDT', 'BINANCE', Interval.in_1_hour)
+        seis2 = Seis('BTCUSDT', 'BINANCE', Interval.in_1_hour)
+        sat.append(seis1, datetime.now())
+        sat.append(seis2)
+        assert sat.get_seis('BTCUSDT', 'BINANCE', Interval.in_1_hour) is seis1
+
+        sat.discard(seis1)
+
+        assert sat.get_seis('BTCUSDT', 'BINANCE', Interval.in_1_hour) is seis2
+        assert sat['1H'] == [seis2]
+
     def test_sat_discard_not_found_raises(self):
         """Test discard raises KeyError when Seis not found"""
         sat = TvDatafeedLive._SeisesAndTrigger()
@@ -615,6 +639,19 @@ class TestNewSeis:
 
         assert result == existing_seis
 
+    def test_new_seis_existing_seis_skips_symbol_search(self, mock_tvdatafeedlive):
+        """Test new_seis does not search TradingView again for a listed Seis"""
+        tvl = mock_tvdatafeedlive
+
+        existing_seis = Seis('BTCUSDT', 'BINANCE', Interval.in_1_hour)
+        tvl._sat.append(existing_seis, datetime.now())
+
+        with patch.object(tvl, 'search_symbol') as mock_search:
+            result = tvl.new_seis('BTCUSDT', 'BINANCE', Interval.in_1_hour)
+
+        assert result is existing_seis
+        mock_search.assert_not_called()
+
     def test_new_seis_creates_new_seis(self, mock_tvdatafeedlive, sample_ohlcv_data):
         """Test new_seis creates and returns new Seis"""
         tvl = mock_tvdatafeedlive
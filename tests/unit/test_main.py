@@ -181,6 +181,46 @@ class TestTvDatafeed:
         assert 'volume' in df.columns
         assert df['volume'].iloc[0] == 0.0
 
+    def test_create_df_no_volume_keeps_ohlc(self):
+        """Test bars without volume keep their OHLC values"""
+        raw_data = (
+            '{"s":[{"i":0,"v":[1609459200,1.0,2.0,0.5,1.5]},'
+            '{"i":1,"v":[1609462800,1.5,2.5,1.0,2.0]}]}'
+        )
+
+        tv = TvDatafeed()
+        df = tv._TvDatafeed__create_df(raw_data, 'BTCUSDT')
+
+        assert df[['open', 'high', 'low', 'close']].values.tolist() == [
+            [1.0, 2.0, 0.5, 1.5],
+            [1.5, 2.5, 1.0, 2.0],
+        ]
+        assert df['volume'].tolist() == [0.0, 0.0]
+
+    def test_create_df_empty_series(self):
+        """Test an empty series is reported as no data"""
+        tv = TvDatafeed()
+
+        df = tv._TvDatafeed__create_df('{"s":[]}]}', 'BTCUSDT')
+
+        assert df is None
+
+    def test_create_df_truncated_bar_raises(self):
+        """Test a bar missing OHLC values is not padded with zeros"""
+        raw_data = '{"s":[{"i":0,"v":[1609459200,1.0,2.0]}]}'
+
+        tv = TvDatafeed()
+        with pytest.raises(IndexError):
+            tv._TvDatafeed__create_df(raw_data, 'BTCUSDT')
+
+    def test_create_df_bar_without_values_raises(self):
+        """Test a bar without a value list raises"""
+        raw_data = '{"s":[{"i":0,"v":null}]}'
+
+        tv = TvDatafeed()
+        with pytest.raises(ValueError):
+            tv._TvDatafeed__create_df(raw_data, 'BTCUSDT')
+
     def test_auth_captcha_required(self):
         """Test authentication when CAPTCHA is required"""
         mock_response = Mock()
@@ -9,18 +9,12 @@ These tests verify the token management functionality including:
 """
 
 import os
-import sys
 import json
 import pytest
 import tempfile
-from pathlib import Path
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock, mock_open
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 
 # Sample JWT tokens for testing
 # These are fake tokens with valid JWT structure
@@ -10,13 +10,38 @@ Based on the implementation from: https://github.com/dovudo/tradingview-websocke
 import re
 import platform
 import logging
+import functools
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Tuple
 
 from .exceptions import AuthenticationError
 
 logger = logging.getLogger(__name__)
 
+# HTTPS connection pool sizing for the auth session
+_POOL_CONNECTIONS = 2
+_POOL_MAXSIZE = 10
+
+# User data fields embedded in the TradingView home page HTML
+_USER_ID_RE = re.compile(r'"id":([0-9]{1,10}),')
+_USERNAME_RE = re.compile(r'"username":"(.*?)"')
+_FIRST_NAME_RE = re.compile(r'"first_name":"(.*?)"')
+_LAST_NAME_RE = re.compile(r'"last_name":"(.*?)"')
+_REPUTATION_RE = re.compile(r'"reputation":(.*?),')
+_FOLLOWING_RE = re.compile(r',"following":([0-9]*?),')
+_FOLLOWERS_RE = re.compile(r',"followers":([0-9]*?),')
+_SESSION_HASH_RE = re.compile(r'"session_hash":"(.*?)"')
+_PRIVATE_CHANNEL_RE = re.compile(r'"private_channel":"(.*?)"')
+_AUTH_TOKEN_RE = re.compile(r'"auth_token":"(.*?)"')
+_DATE_JOINED_RE = re.compile(r'"date_joined":"(.*?)"')
+
+
+@functools.lru_cache(maxsize=1)
+def _platform_triple() -> Tuple[str, str, str]:
+    """Return (system, release, machine) for the running host, looked up once"""
+    return platform.system(), platform.release(), platform.machine()
+
 
 class TradingViewAuth:
     """Handle TradingView authentication using HTTP requests"""
@@ -30,12 +55,16 @@ class TradingViewAuth:
         """
         self.user_agent = user_agent or self._generate_user_agent()
         self.session = requests.Session()
+        # Session already keeps HTTPS connections alive; this only sizes the
+        # pool for the single host (www.tradingview.com) the auth flow talks to
+        self.session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE)
+        )
 
     def _generate_user_agent(self) -> str:
         """Generate a user agent string similar to TradingView API clients"""
-        system = platform.system()
-        release = platform.release()
-        machine = platform.machine()
+        system, release, machine = _platform_triple()
         return f"TWAPI/3.0 ({release}; {system}; {machine})"
 
     @staticmethod
@@ -309,47 +338,47 @@ class TradingViewAuth:
             user_data = {}
 
             # Extract user ID
-            match = re.search(r'"id":([0-9]{1,10}),', html)
+            match = _USER_ID_RE.search(html)
             user_data['id'] = int(match.group(1)) if match else None
 
             # Extract username
-            match = re.search(r'"username":"(.*?)"', html)
+            match = _USERNAME_RE.search(html)
             user_data['username'] = match.group(1) if match else None
 
             # Extract first name
-            match = re.search(r'"first_name":"(.*?)"', html)
+            match = _FIRST_NAME_RE.search(html)
             user_data['firstName'] = match.group(1) if match else ""
 
             # Extract last name
-            match = re.search(r'"last_name":"(.*?)"', html)
+            match = _LAST_NAME_RE.search(html)
             user_data['lastName'] = match.group(1) if match else ""
 
             # Extract reputation
-            match = re.search(r'"reputation":(.*?),', html)
+            match = _REPUTATION_RE.search(html)
             user_data['reputation'] = float(match.group(1)) if match else 0.0
 
             # Extract following count
-            match = re.search(r',"following":([0-9]*?),', html)
+            match = _FOLLOWING_RE.search(html)
             user_data['following'] = int(match.group(1)) if match else 0
 
             # Extract followers count
-            match = re.search(r',"followers":([0-9]*?),', html)
+            match = _FOLLOWERS_RE.search(html)
             user_data['followers'] = int(match.group(1)) if match else 0
 
             # Extract session hash
-            match = re.search(r'"session_hash":"(.*?)"', html)
+            match = _SESSION_HASH_RE.search(html)
             user_data['sessionHash'] = match.group(1) if match else None
 
             # Extract private channel
-            match = re.search(r'"private_channel":"(.*?)"', html)
+            match = _PRIVATE_CHANNEL_RE.search(html)
             user_data['privateChannel'] = match.group(1) if match else None
 
             # Extract auth token (THIS IS THE KEY!)
-            match = re.search(r'"auth_token":"(.*?)"', html)
+            match = _AUTH_TOKEN_RE.search(html)
             user_data['authToken'] = match.group(1) if match else None
 
             # Extract join date
-            match = re.search(r'"date_joined":"(.*?)"', html)
+            match = _DATE_JOINED_RE.search(html)
             user_data['joinDate'] = match.group(1) if match else None
 
             logger.debug(f"User data extracted: ID={user_data.get('id')}, Username={user_data.get('username')}")
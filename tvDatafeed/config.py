@@ -5,11 +5,35 @@ This module centralizes all configuration parameters to avoid hardcoded values
 and make the library more flexible and testable.
 """
 import os
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 
+# Config objects are plain attribute bags; drop their per-instance __dict__
+# where dataclass slots are available (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _env_bool(value: str) -> bool:
+    """Parse a 'true'/'false' environment flag (case-insensitive)"""
+    return value.lower() == 'true'
+
+
+def _from_env(cls):
+    """
+    Build a config from the environment variables listed in cls._ENV_FIELDS
+
+    Unset variables are left out so the dataclass defaults apply.
+    """
+    kwargs = {}
+    for attr, env_var, cast in cls._ENV_FIELDS:
+        value = os.environ.get(env_var)
+        if value is not None:
+            kwargs[attr] = cast(value)
+    return cls(**kwargs)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class NetworkConfig:
     """
     Network configuration for WebSocket and HTTP connections
@@ -44,6 +68,18 @@ class NetworkConfig:
     # Rate limiting
     requests_per_minute: int = 60
 
+    # (attribute, environment variable, cast) read by from_env
+    _ENV_FIELDS = (
+        ('ws_url', 'TV_WS_URL', str),
+        ('connect_timeout', 'TV_CONNECT_TIMEOUT', float),
+        ('send_timeout', 'TV_SEND_TIMEOUT', float),
+        ('recv_timeout', 'TV_RECV_TIMEOUT', float),
+        ('max_retries', 'TV_MAX_RETRIES', int),
+        ('base_retry_delay', 'TV_BASE_RETRY_DELAY', float),
+        ('max_retry_delay', 'TV_MAX_RETRY_DELAY', float),
+        ('requests_per_minute', 'TV_REQUESTS_PER_MINUTE', int),
+    )
+
     @classmethod
     def from_env(cls) -> 'NetworkConfig':
         """
@@ -62,19 +98,10 @@ class NetworkConfig:
         Returns:
             NetworkConfig instance with values from environment
         """
-        return cls(
-            ws_url=os.getenv('TV_WS_URL', cls.ws_url),
-            connect_timeout=float(os.getenv('TV_CONNECT_TIMEOUT', str(cls.connect_timeout))),
-            send_timeout=float(os.getenv('TV_SEND_TIMEOUT', str(cls.send_timeout))),
-            recv_timeout=float(os.getenv('TV_RECV_TIMEOUT', str(cls.recv_timeout))),
-            max_retries=int(os.getenv('TV_MAX_RETRIES', str(cls.max_retries))),
-            base_retry_delay=float(os.getenv('TV_BASE_RETRY_DELAY', str(cls.base_retry_delay))),
-            max_retry_delay=float(os.getenv('TV_MAX_RETRY_DELAY', str(cls.max_retry_delay))),
-            requests_per_minute=int(os.getenv('TV_REQUESTS_PER_MINUTE', str(cls.requests_per_minute))),
-        )
+        return _from_env(cls)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AuthConfig:
     """
     Authentication configuration
@@ -96,6 +123,12 @@ class AuthConfig:
     password: Optional[str] = None
     two_factor_code: Optional[str] = None
 
+    _ENV_FIELDS = (
+        ('username', 'TV_USERNAME', str),
+        ('password', 'TV_PASSWORD', str),
+        ('two_factor_code', 'TV_2FA_CODE', str),
+    )
+
     @classmethod
     def from_env(cls) -> 'AuthConfig':
         """
@@ -109,14 +142,10 @@ class AuthConfig:
         Returns:
             AuthConfig instance with credentials from environment
         """
-        return cls(
-            username=os.getenv('TV_USERNAME'),
-            password=os.getenv('TV_PASSWORD'),
-            two_factor_code=os.getenv('TV_2FA_CODE'),
-        )
+        return _from_env(cls)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DataConfig:
     """
     Data processing configuration
@@ -135,19 +164,21 @@ class DataConfig:
     fill_missing_volume: str = 'zero'
     timezone: str = 'UTC'
 
+    _ENV_FIELDS = (
+        ('max_bars', 'TV_MAX_BARS', int),
+        ('default_bars', 'TV_DEFAULT_BARS', int),
+        ('validate_data', 'TV_VALIDATE_DATA', _env_bool),
+        ('fill_missing_volume', 'TV_FILL_MISSING_VOLUME', str),
+        ('timezone', 'TV_TIMEZONE', str),
+    )
+
     @classmethod
     def from_env(cls) -> 'DataConfig':
         """Create DataConfig from environment variables"""
-        return cls(
-            max_bars=int(os.getenv('TV_MAX_BARS', str(cls.max_bars))),
-            default_bars=int(os.getenv('TV_DEFAULT_BARS', str(cls.default_bars))),
-            validate_data=os.getenv('TV_VALIDATE_DATA', 'true').lower() == 'true',
-            fill_missing_volume=os.getenv('TV_FILL_MISSING_VOLUME', cls.fill_missing_volume),
-            timezone=os.getenv('TV_TIMEZONE', cls.timezone),
-        )
+        return _from_env(cls)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ThreadingConfig:
     """
     Threading configuration for TvDatafeedLive
@@ -162,17 +193,19 @@ class ThreadingConfig:
     retry_sleep: float = 0.1
     shutdown_timeout: float = 10.0
 
+    _ENV_FIELDS = (
+        ('retry_limit', 'TV_RETRY_LIMIT', int),
+        ('retry_sleep', 'TV_RETRY_SLEEP', float),
+        ('shutdown_timeout', 'TV_SHUTDOWN_TIMEOUT', float),
+    )
+
     @classmethod
     def from_env(cls) -> 'ThreadingConfig':
         """Create ThreadingConfig from environment variables"""
-        return cls(
-            retry_limit=int(os.getenv('TV_RETRY_LIMIT', str(cls.retry_limit))),
-            retry_sleep=float(os.getenv('TV_RETRY_SLEEP', str(cls.retry_sleep))),
-            shutdown_timeout=float(os.getenv('TV_SHUTDOWN_TIMEOUT', str(cls.shutdown_timeout))),
-        )
+        return _from_env(cls)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TvDatafeedConfig:
     """
     Global configuration for TvDatafeed
@@ -206,7 +239,7 @@ class TvDatafeedConfig:
             auth=AuthConfig.from_env(),
             data=DataConfig.from_env(),
             threading=ThreadingConfig.from_env(),
-            debug=os.getenv('TV_DEBUG', 'false').lower() == 'true',
+            debug=_env_bool(os.getenv('TV_DEBUG', 'false')),
         )
 
     @classmethod
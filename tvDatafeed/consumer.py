@@ -92,11 +92,9 @@ class Consumer(threading.Thread):
                     if self._stopped:
                         break
 
-                try:
-                    # Use timeout to allow periodic check of stopped flag
-                    data = self._buffer.get(timeout=1.0)
-                except queue.Empty:
-                    continue  # Check stopped flag again
+                # Block until data arrives; stop() always queues a None
+                # sentinel, so there is no need to wake up periodically
+                data = self._buffer.get()
 
                 if data is None:
                     break
@@ -171,9 +169,6 @@ class Consumer(threading.Thread):
                 return  # Already stopped
             self._stopped = True
 
-        # Put None to signal shutdown - use non-blocking to avoid deadlock
-        try:
-            self._buffer.put(None, timeout=1.0)
-        except queue.Full:
-            pass  # Thread will check _stopped flag anyway
+        # Put None to wake run() and signal shutdown
+        self._buffer.put(None)
         
\ No newline at end of file
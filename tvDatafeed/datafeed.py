@@ -55,6 +55,7 @@ class TvDatafeedLive(tvDatafeed.TvDatafeed):
             self._trigger_dt=None
             self._trigger_interrupt=threading.Event()
             self._state_lock=threading.Lock()  # Lock for _trigger_quit and _trigger_dt
+            self._seis_index={} # (symbol, exchange, interval) -> Seis, for constant time get_seis()
             
             # time periods available in TradingView 
             self._timeframes={"1":rd(minutes=1), "3":rd(minutes=3), "5":rd(minutes=5), \
@@ -79,11 +80,7 @@ class TvDatafeedLive(tvDatafeed.TvDatafeed):
             # Returns Seis object listed in SAT based on
             # symbol, exchange and interval. If not listed then 
             # None is returned
-            for seis in self:
-                if seis.symbol==symbol and seis.exchange==exchange and seis.interval==interval:
-                    return seis
-            
-            return None
+            return self._seis_index.get((symbol, exchange, interval))
             
         def wait(self):
             # Wait until next interval(s) expire
@@ -148,12 +145,14 @@ class TvDatafeedLive(tvDatafeed.TvDatafeed):
 
             if seis.interval.value in self.keys(): # interval group already exists
                 super().__getitem__(seis.interval.value)[0].append(seis)
+                self._seis_index.setdefault((seis.symbol, seis.exchange, seis.interval), seis)
             else: # new interval group needs to be created
                 if update_dt is None:
                     raise ValueError("Missing update datetime for new interval group")
                 else:
                     update_dt= update_dt + self._timeframes[seis.interval.value] # change the time to next update datetime (result will be datetime object)
                     self.__setitem__(seis.interval.value, [[seis], update_dt])
+                    self._seis_index.setdefault((seis.symbol, seis.exchange, seis.interval), seis)
 
                     with self._state_lock:
                         if (trigger_dt := self._next_trigger_dt()) != self._trigger_dt: # if new interval group expiry is sooner than current expiry being waited on
@@ -166,6 +165,14 @@ class TvDatafeedLive(tvDatafeed.TvDatafeed):
                 raise KeyError("No such Seis in the list")
             else:
                 super().__getitem__(seis.interval.value)[0].remove(seis)
+
+                # keep the index pointing at the first remaining equal Seis, if any
+                key=(seis.symbol, seis.exchange, seis.interval)
+                remaining=[s for s in super().__getitem__(seis.interval.value)[0] if s==seis]
+                if remaining:
+                    self._seis_index[key]=remaining[0]
+                else:
+                    self._seis_index.pop(key, None)
                 if not super().__getitem__(seis.interval.value)[0]: # if interval group now empty then remove it
                     self.pop(seis.interval.value)
 
@@ -258,6 +265,11 @@ class TvDatafeedLive(tvDatafeed.TvDatafeed):
             If provided symbol and exchange combination is
             not listed on TradingView
         '''
+        # An already listed Seis was validated when it was created, so skip
+        # the symbol search round trip (dict lookup is atomic, no lock needed)
+        if not self._shutdown_in_progress and (seis := self._sat.get_seis(symbol, exchange, interval)):
+            return seis
+
         if self._args_invalid(symbol, exchange):
             raise ValueError("Provided symbol and exchange combination is not listed in TradingView")
 
@@ -62,6 +62,12 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# Patterns used to parse WebSocket payloads, compiled once at import
+_MESSAGE_TYPE_RE = re.compile('"m":"(.+?)",')
+_MESSAGE_PARAMS_RE = re.compile('"p":(.+?"}"])}')
+# Only a series holding at least one bar matches; an empty "s":[] is no data
+_SERIES_RE = re.compile(r'"s":\[(\{.+?)\}\]')
+
 
 def _get_timezone_object(tz_name: str):
     """
@@ -568,8 +574,8 @@ class TvDatafeed:
     @staticmethod
     def __filter_raw_message(text):
         try:
-            found = re.search('"m":"(.+?)",', text).group(1)
-            found2 = re.search('"p":(.+?"}"])}', text).group(1)
+            found = _MESSAGE_TYPE_RE.search(text).group(1)
+            found2 = _MESSAGE_PARAMS_RE.search(text).group(1)
 
             return found, found2
         except AttributeError:
@@ -636,16 +642,18 @@ class TvDatafeed:
         - If tz_object is None: datetimes are timezone-naive in local time (default)
         """
         try:
-            out = re.search(r'"s":\[(.+?)\}\]', raw_data).group(1)
+            out = _SERIES_RE.search(raw_data).group(1)
             x = out.split(',{"')
             data = list()
             volume_data = True
 
             for xi in x:
-                xi = re.split(r"\[|:|,|\]", xi)
+                # Each bar looks like '"i":0,"v":[ts,open,high,low,close,volume]';
+                # slicing out the value list is cheaper than a regex split
+                xi = xi[xi.index("[") + 1:xi.index("]")].split(",")
                 # Convert Unix timestamp to datetime
                 # TradingView sends timestamps as Unix epoch (seconds)
-                unix_ts = float(xi[4])
+                unix_ts = float(xi[0])
 
                 if tz_object is not None:
                     # Timezone-aware datetime in specified timezone
@@ -656,10 +664,15 @@ class TvDatafeed:
 
                 row = [ts]
 
-                for i in range(5, 10):
+                # only a missing volume field is tolerated; a bar short of
+                # its OHLC values still raises IndexError below
+                if len(xi) < 6:
+                    volume_data = False
+
+                for i in range(1, 6):
 
                     # skip converting volume data if does not exists
-                    if not volume_data and i == 9:
+                    if not volume_data and i == 5:
                         row.append(0.0)
                         continue
                     try:
@@ -837,7 +850,9 @@ class TvDatafeed:
         - Prevents infinite blocking if "series_completed" never arrives
         - Individual message timeouts are still handled by the WebSocket timeout
         """
-        raw_data = ""
+        # Frames are collected in a list and joined once at the end;
+        # repeated string concatenation would copy the buffer per frame
+        frames = []
         start_time = time.time()
         message_count = 0
 
@@ -864,7 +879,7 @@ class TvDatafeed:
 
             try:
                 result = self.ws.recv()
-                raw_data = raw_data + result + "\n"
+                frames.append(result)
                 message_count += 1
             except TimeoutError as e:
                 elapsed_time = time.time() - start_time
@@ -894,7 +909,7 @@ class TvDatafeed:
                 )
                 break
 
-        return raw_data
+        return "\n".join(frames) + "\n"
 
     def get_hist(
         self,
@@ -1190,10 +1205,7 @@ class TvDatafeed:
 
         if df is None:
             logger.warning(f"No data returned for {symbol} on {exchange}")
-            raise DataNotFoundError(
-                f"No data available for {symbol} on {exchange}. "
-                f"Please verify the symbol and exchange are correct."
-            )
+            raise DataNotFoundError(symbol, exchange)
 
         logger.info(f"Successfully retrieved {len(df)} bars for {symbol}")
         return df